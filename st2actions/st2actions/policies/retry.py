@@ -15,7 +15,7 @@
 
 from __future__ import absolute_import
 
-import functools
+import logging as stdlib_logging
 
 import eventlet
 
@@ -26,13 +26,14 @@ from st2common.constants.action import LIVEACTION_STATUS_FAILED
 from st2common.constants.action import LIVEACTION_STATUS_TIMED_OUT
 from st2common.util.enum import Enum
 from st2common.policies.base import ResourcePolicyApplicator
-from st2common.util.deep_copy import fast_deepcopy_dict
 
 __all__ = ["RetryOnPolicy", "ExecutionRetryPolicyApplicator"]
 
 LOG = logging.getLogger(__name__)
 
-VALID_RETRY_STATUSES = [LIVEACTION_STATUS_FAILED, LIVEACTION_STATUS_TIMED_OUT]
+VALID_RETRY_STATUSES = frozenset(
+    (LIVEACTION_STATUS_FAILED, LIVEACTION_STATUS_TIMED_OUT)
+)
 
 
 class RetryOnPolicy(Enum):
@@ -60,6 +61,19 @@ class ExecutionRetryPolicyApplicator(ResourcePolicyApplicator):
         self.max_retry_count = max_retry_count
         self.delay = delay or 0
 
+        # retry_on and delay are fixed for the lifetime of the applicator so we resolve the
+        # matching conditions and the re-run dispatch function once here instead of on every
+        # apply_after() call
+        self._retry_on_failure = retry_on == RetryOnPolicy.FAILURE
+        self._retry_on_timeout = retry_on == RetryOnPolicy.TIMEOUT
+
+        # TODO: This is not crash and restart safe, switch to using "DELAYED"
+        # status
+        if self.delay > 0:
+            self._dispatch_re_run_live_action = self._spawn_re_run_live_action
+        else:
+            self._dispatch_re_run_live_action = self._re_run_live_action
+
     def apply_after(self, target):
         target = super(ExecutionRetryPolicyApplicator, self).apply_after(target=target)
 
@@ -74,24 +88,21 @@ class ExecutionRetryPolicyApplicator(ResourcePolicyApplicator):
 
             return target
 
-        retry_count = self._get_live_action_retry_count(live_action_db=live_action_db)
-
-        extra = {
-            "live_action_db": live_action_db,
-            "policy_ref": self._policy_ref,
-            "retry_on": self.retry_on,
-            "max_retry_count": self.max_retry_count,
-            "current_retry_count": retry_count,
-        }
-
         if live_action_db.status not in VALID_RETRY_STATUSES:
-            # Currently we only support retrying on failed action
-            LOG.debug(
-                "Liveaction not in a valid retry state, not checking retry policy",
-                extra=extra,
-            )
+            # Currently we only support retrying on failed action. This is the common (success)
+            # path so we avoid building log context unless it will actually be used.
+            if LOG.isEnabledFor(stdlib_logging.DEBUG):
+                LOG.debug(
+                    "Liveaction not in a valid retry state, not checking retry policy",
+                    extra=self._get_log_extra(live_action_db=live_action_db),
+                )
             return target
 
+        retry_count = self._get_live_action_retry_count(live_action_db=live_action_db)
+        extra = self._get_log_extra(
+            live_action_db=live_action_db, retry_count=retry_count
+        )
+
         if (retry_count + 1) > self.max_retry_count:
             LOG.info("Maximum retry count has been reached, not retrying", extra=extra)
             return target
@@ -99,67 +110,71 @@ class ExecutionRetryPolicyApplicator(ResourcePolicyApplicator):
         has_failed = live_action_db.status == LIVEACTION_STATUS_FAILED
         has_timed_out = live_action_db.status == LIVEACTION_STATUS_TIMED_OUT
 
-        # TODO: This is not crash and restart safe, switch to using "DELAYED"
-        # status
-        if self.delay > 0:
-            re_run_live_action = functools.partial(
-                eventlet.spawn_after,
-                self.delay,
-                self._re_run_live_action,
-                live_action_db=live_action_db,
-            )
-        else:
-            # Even if delay is 0, use a small delay (0.1 seconds) to prevent busy wait
-            re_run_live_action = functools.partial(
-                eventlet.spawn_after,
-                0.1,
-                self._re_run_live_action,
-                live_action_db=live_action_db,
-            )
-
-            re_run_live_action = functools.partial(
-                self._re_run_live_action, live_action_db=live_action_db
-            )
-
-        if has_failed and self.retry_on == RetryOnPolicy.FAILURE:
+        if has_failed and self._retry_on_failure:
             extra["failure"] = True
             LOG.info(
-                "Policy matched (failure), retrying action execution in %s seconds..."
-                % (self.delay),
+                "Policy matched (failure), retrying action execution in %s seconds...",
+                self.delay,
                 extra=extra,
             )
-            re_run_live_action()
+            self._dispatch_re_run_live_action(
+                live_action_db=live_action_db, retry_count=retry_count
+            )
             return target
 
-        if has_timed_out and self.retry_on == RetryOnPolicy.TIMEOUT:
+        if has_timed_out and self._retry_on_timeout:
             extra["timeout"] = True
             LOG.info(
-                "Policy matched (timeout), retrying action execution in %s seconds..."
-                % (self.delay),
+                "Policy matched (timeout), retrying action execution in %s seconds...",
+                self.delay,
                 extra=extra,
             )
-            re_run_live_action()
+            self._dispatch_re_run_live_action(
+                live_action_db=live_action_db, retry_count=retry_count
+            )
             return target
 
         LOG.info(
-            'Invalid status "%s" for live action "%s", wont retry'
-            % (live_action_db.status, str(live_action_db.id)),
+            'Invalid status "%s" for live action "%s", wont retry',
+            live_action_db.status,
+            live_action_db.id,
             extra=extra,
         )
 
         return target
 
-    def _is_live_action_part_of_workflow_action(self, live_action_db):
+    def _get_log_extra(self, live_action_db, retry_count=None):
         """
-        Retrieve parent info from context of the live action.
+        Build the "extra" context which is passed to the log messages.
 
         :rtype: ``dict``
         """
-        context = getattr(live_action_db, "context", {})
-        parent = context.get("parent", {})
-        is_wf_action = parent is not None and parent != {}
+        if retry_count is None:
+            retry_count = self._get_live_action_retry_count(
+                live_action_db=live_action_db
+            )
+
+        extra = {
+            "live_action_db": live_action_db,
+            "policy_ref": self._policy_ref,
+            "retry_on": self.retry_on,
+            "max_retry_count": self.max_retry_count,
+            "current_retry_count": retry_count,
+        }
+        return extra
+
+    def _is_live_action_part_of_workflow_action(self, live_action_db):
+        """
+        Return True if the live action has parent info in the context (aka it's executed under
+        a workflow).
 
-        return is_wf_action
+        :rtype: ``bool``
+        """
+        context = getattr(live_action_db, "context", None)
+        if not context:
+            return False
+
+        return bool(context.get("parent"))
 
     def _get_live_action_retry_count(self, live_action_db):
         """
@@ -174,17 +189,42 @@ class ExecutionRetryPolicyApplicator(ResourcePolicyApplicator):
 
         return retry_count
 
-    def _re_run_live_action(self, live_action_db):
-        retry_count = self._get_live_action_retry_count(live_action_db=live_action_db)
+    def _spawn_re_run_live_action(self, live_action_db, retry_count=None):
+        """
+        Schedule a new execution of the provided live action after the configured delay.
+        """
+        eventlet.spawn_after(
+            self.delay,
+            self._re_run_live_action,
+            live_action_db=live_action_db,
+            retry_count=retry_count,
+        )
+
+    def _re_run_live_action(self, live_action_db, retry_count=None):
+        """
+        Schedule a new execution of the provided live action.
+
+        :param retry_count: Current retry count of the live action. If not provided, it's
+                            retrieved from the live action context.
+        :type retry_count: ``int``
+        """
+        if retry_count is None:
+            retry_count = self._get_live_action_retry_count(
+                live_action_db=live_action_db
+            )
 
         # Add additional policy specific info to the context
         context = getattr(live_action_db, "context", {})
-        new_context = fast_deepcopy_dict(context)
-        new_context["policies"] = {}
-        new_context["policies"]["retry"] = {
-            "applied_policy": self._policy_ref,
-            "retry_count": (retry_count + 1),
-            "retried_liveaction_id": str(live_action_db.id),
+        # Note: Only top-level keys are modified (here and in action_services.request), so a
+        # shallow copy is sufficient and avoids deep copying the whole (potentially large)
+        # context on every retry
+        new_context = dict(context)
+        new_context["policies"] = {
+            "retry": {
+                "applied_policy": self._policy_ref,
+                "retry_count": (retry_count + 1),
+                "retried_liveaction_id": str(live_action_db.id),
+            }
         }
         action_ref = live_action_db.action
         parameters = live_action_db.parameters
@@ -13,48 +13,58 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
 import time
 import atexit
 import platform
 import cProfile
+from typing import Callable
+from typing import Dict
 
 import eventlet
+from eventlet import tpool
 from eventlet.green import profile
 
 __all__ = ["setup_regular_profiler", "setup_eventlet_profiler"]
 
+# Maps service name to the profiler which has already been set up for it in this process. Used to
+# make sure we only ever attach a single profiler (and exit handler) per service.
+_ACTIVE_PROFILERS: Dict[str, object] = {}
+
+# Machine type doesn't change during the process lifetime so we only look it up once
+_MACHINE = platform.machine()
+
 
 def setup_regular_profiler(service_name: str) -> None:
     """
     Set up regular Python cProf profiler and write result to a file on exit.
+
+    Calling this function multiple times for the same service is a no-op.
     """
+    if service_name in _ACTIVE_PROFILERS:
+        return
+
     profiler = cProfile.Profile()
     profiler.enable()
+    _ACTIVE_PROFILERS[service_name] = profiler
 
-    file_path = os.path.join(
-        "/tmp", "%s-%s-%s.cprof" % (service_name, platform.machine(), int(time.time()))
+    _install_dumper(
+        service_name=service_name,
+        stop_func=profiler.disable,
+        dump_func=profiler.dump_stats,
     )
 
-    print("Eventlet profiler enabled")
-    print("Profiling data will be saved to %s on exit" % (file_path))
-
-    def stop_profiler():
-        profiler.disable()
-        profiler.dump_stats(file_path)
-        print("Profiling data written to %s" % (file_path))
-        print("You can view it using: ")
-        print("\t python3 -m pstats %s" % (file_path))
-
-    atexit.register(stop_profiler)
-
 
 def setup_eventlet_profiler(service_name: str) -> None:
     """
     Set up eventlet profiler and write results to a file on exit.
 
     Only to be used with eventlet code (aka an StackStorm service minus the CLI).
+
+    Calling this function multiple times for the same service is a no-op.
     """
+    if service_name in _ACTIVE_PROFILERS:
+        return
+
     is_patched = eventlet.patcher.is_monkey_patched("os")
     if not is_patched:
         raise ValueError(
@@ -63,17 +73,36 @@ def setup_eventlet_profiler(service_name: str) -> None:
 
     profiler = profile.Profile()
     profiler.start()
+    _ACTIVE_PROFILERS[service_name] = profiler
 
-    file_path = os.path.join(
-        "/tmp", "%s-%s-%s.cprof" % (service_name, platform.machine(), int(time.time()))
+    def dump_stats(file_path):
+        # Writing the stats can take a while for long running services. Do it in a native OS
+        # thread so we don't block the eventlet hub and other greenlets can still finish during
+        # shutdown.
+        tpool.execute(profiler.dump_stats, file_path)
+
+    _install_dumper(
+        service_name=service_name, stop_func=profiler.stop, dump_func=dump_stats
     )
 
-    print("Eventlet profiler enabled")
+
+def _install_dumper(
+    service_name: str,
+    stop_func: Callable[[], None],
+    dump_func: Callable[[str], None],
+) -> None:
+    """
+    Register an exit handler which stops the profiler using ``stop_func`` and writes the
+    profiling data to a file using ``dump_func``.
+    """
+    file_path = f"/tmp/{service_name}-{_MACHINE}-{int(time.time())}.cprof"
+
+    print("Profiler enabled")
     print("Profiling data will be saved to %s on exit" % (file_path))
 
     def stop_profiler():
-        profiler.stop()
-        profiler.dump_stats(file_path)
+        stop_func()
+        dump_func(file_path)
         print("Profiling data written to %s" % (file_path))
         print("You can view it using: ")
         print("\t python3 -m pstats %s" % (file_path))